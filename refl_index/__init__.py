@@ -1,9 +1,9 @@
 """refl-index: Sidecar index for DIALS .refl msgpack files."""
 
 from .dtypes import DIALS_TYPES
-from .indexer import ColumnInfo, ReflIndex
+from .indexer import ColumnInfo, ReflIndex, ValidationResult
 
-__all__ = ["ReflIndex", "ColumnInfo", "DIALS_TYPES"]
+__all__ = ["ReflIndex", "ColumnInfo", "ValidationResult", "DIALS_TYPES"]
 
 # ReflReader is imported lazily since it requires numpy
 def __getattr__(name):
@@ -0,0 +1,25 @@
+"""Row-range checks shared by ReflReader and CompressedReader.
+
+``col`` is anything with ``name`` and ``count`` attributes (a ColumnInfo,
+or a compressed sidecar's column entry).
+"""
+
+
+def check_range(col, start: int, stop: int):
+    """Raise if ``[start, stop)`` is not a valid row range of ``col``."""
+    # All three bounds in one sign test: the OR is negative iff one of
+    # start, stop - start, count - stop is. Messages are built off the hot path.
+    if (start | (stop - start) | (col.count - stop)) < 0:
+        raise_range(col, start, stop)
+
+
+def raise_range(col, start: int, stop: int):
+    """Raise the error describing why ``[start, stop)`` is out of range."""
+    if start < 0 or stop < 0:
+        raise ValueError(f"start and stop must be non-negative (got start={start}, stop={stop})")
+    if start > stop:
+        raise ValueError(f"start ({start}) must be <= stop ({stop})")
+    if stop > col.count:
+        raise IndexError(
+            f"stop ({stop}) exceeds row count ({col.count}) for column {col.name!r}"
+        )
@@ -0,0 +1,33 @@
+"""Compiled predicate kernels for ReflReader (numba optional).
+
+Each kernel takes read-only column views straight from the mapping and
+returns a result without per-row Python dispatch. When numba is not
+installed, the NumPy vectorized equivalents are used instead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+
+def _flag_mask_numpy(flags: np.ndarray, mask_bit) -> np.ndarray:
+    return (flags & mask_bit) != 0
+
+
+# flag_mask(flags, mask_bit) -> bool array: rows whose flags share any bit with mask_bit
+if HAVE_NUMBA:
+    @njit(cache=True, boundscheck=False)
+    def _flag_mask_numba(flags, mask_bit):
+        out = np.empty(flags.shape[0], dtype=np.bool_)
+        for i in range(flags.shape[0]):
+            out[i] = (flags[i] & mask_bit) != 0
+        return out
+
+    flag_mask = _flag_mask_numba
+else:
+    flag_mask = _flag_mask_numpy
@@ -1,4 +1,4 @@
-"""CLI: refl-index build|info|read"""
+"""CLI: refl-index build|info|read|compress"""
 
 import argparse
 import sys
@@ -15,10 +15,10 @@ def cmd_build(args):
         return 1
 
     print(f"Building index for {refl_path} ...")
-    index = ReflIndex.build(refl_path)
+    index = ReflIndex.build(refl_path, validate=not args.no_validate, checksums=args.checksums)
 
     out_path = Path(args.output) if args.output else None
-    saved = index.save(out_path)
+    saved = index.save(out_path, indent=args.indent, format=args.format)
     print(f"Saved index to {saved}")
     print(f"  rows:        {index.nrows:,}")
     print(f"  identifiers: {index.num_identifiers:,}")
@@ -40,6 +40,7 @@ def cmd_info(args):
     print(f"  file_size:   {index.file_size:,}")
     print(f"  nrows:       {index.nrows:,}")
     print(f"  identifiers: {index.num_identifiers:,}")
+    print(f"  byte order:  {index.byte_order}")
     print(f"  columns:     {len(index.columns)}")
     print()
 
@@ -52,6 +53,17 @@ def cmd_info(args):
     return 0
 
 
+def _resolve_refl_path(index, idx_path):
+    """Locate the indexed .refl file, or return None if it cannot be found."""
+    refl_path = Path(index.refl_path)
+    if not refl_path.exists():
+        # Try relative to the index file
+        refl_path = idx_path.parent / refl_path.name
+        if not refl_path.exists():
+            return None
+    return refl_path
+
+
 def cmd_read(args):
     """Read and print column data from a .refl file using its index."""
     try:
@@ -68,15 +80,10 @@ def cmd_read(args):
         return 1
 
     index = ReflIndex.load(idx_path)
-
-    # Resolve .refl file path
-    refl_path = Path(index.refl_path)
-    if not refl_path.exists():
-        # Try relative to the index file
-        refl_path = idx_path.parent / refl_path.name
-        if not refl_path.exists():
-            print(f"Error: .refl file not found: {index.refl_path}", file=sys.stderr)
-            return 1
+    refl_path = _resolve_refl_path(index, idx_path)
+    if refl_path is None:
+        print(f"Error: .refl file not found: {index.refl_path}", file=sys.stderr)
+        return 1
 
     reader = ReflReader(index, refl_path)
 
@@ -109,6 +116,33 @@ def cmd_read(args):
     return 0
 
 
+def cmd_compress(args):
+    """Write a compressed column sidecar for an indexed .refl file."""
+    try:
+        from .compressed import write_compressed
+    except ImportError:
+        print("Error: numpy is required for the 'compress' command. Install with: pip install refl-index[numpy]", file=sys.stderr)
+        return 1
+
+    idx_path = Path(args.index)
+    if not idx_path.exists():
+        print(f"Error: index file not found: {idx_path}", file=sys.stderr)
+        return 1
+
+    index = ReflIndex.load(idx_path)
+    refl_path = _resolve_refl_path(index, idx_path)
+    if refl_path is None:
+        print(f"Error: .refl file not found: {index.refl_path}", file=sys.stderr)
+        return 1
+
+    out_path = Path(args.output) if args.output else None
+    saved = write_compressed(index, out_path, refl_path, codec=args.codec, clevel=args.clevel)
+    size = saved.stat().st_size
+    print(f"Saved compressed columns to {saved}")
+    print(f"  size:        {size:,} bytes ({size / max(index.file_size, 1):.1%} of .refl)")
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog="refl-index",
@@ -120,6 +154,10 @@ def main():
     p_build = subparsers.add_parser("build", help="Build index for a .refl file")
     p_build.add_argument("file", help="Path to .refl file")
     p_build.add_argument("-o", "--output", help="Output path for index (default: <file>.idx)")
+    p_build.add_argument("--indent", action="store_true", help="Pretty-print the JSON index")
+    p_build.add_argument("--format", choices=["json", "binary"], default="json", help="Index file format (default: json)")
+    p_build.add_argument("--no-validate", action="store_true", help="Skip blob size checks (trusted files only)")
+    p_build.add_argument("--checksums", action="store_true", help="Record per-column BLAKE2b digests for deep validation")
 
     # info
     p_info = subparsers.add_parser("info", help="Print column info from an index file")
@@ -134,6 +172,13 @@ def main():
     p_read.add_argument("--head", type=int, help="Number of rows to read from start")
     p_read.add_argument("--at", type=int, help="Read a single row at this index")
 
+    # compress
+    p_compress = subparsers.add_parser("compress", help="Write a compressed column sidecar (.refl.blz)")
+    p_compress.add_argument("index", help="Path to .refl.idx file")
+    p_compress.add_argument("-o", "--output", help="Output path (default: <refl file>.blz)")
+    p_compress.add_argument("--codec", choices=["blosc2", "zlib"], help="Compressor (default: blosc2 if installed, else zlib)")
+    p_compress.add_argument("--clevel", type=int, default=5, help="Compression level (default: 5)")
+
     args = parser.parse_args()
-    commands = {"build": cmd_build, "info": cmd_info, "read": cmd_read}
+    commands = {"build": cmd_build, "info": cmd_info, "read": cmd_read, "compress": cmd_compress}
     sys.exit(commands[args.command](args))
@@ -1,5 +1,10 @@
 """DIALS reflection type → (element_size, numpy_dtype, description) mapping."""
 
+try:
+    import numpy as np
+except ImportError:  # indexing works without numpy; only type_info needs it
+    np = None
+
 # Each entry: (bytes_per_element, numpy_dtype_string, description)
 DIALS_TYPES = {
     "double":                (8,  "<f8", "64-bit float"),
@@ -18,6 +23,12 @@ _MULTI_ELEMENT_COUNTS = {
     "cctbx::miller::index<>": 3,
 }
 
+# Flat per-type tables built once at import time for the read hot path
+_ELEM_SIZE = {k: v[0] for k, v in DIALS_TYPES.items()}
+_SUB_ELEMS = {k: _MULTI_ELEMENT_COUNTS.get(k, 1) for k in DIALS_TYPES}
+_DTYPE_OBJ = {k: np.dtype(v[1]) for k, v in DIALS_TYPES.items()} if np is not None else {}
+_TYPE_INFO = {k: (_DTYPE_OBJ[k], _ELEM_SIZE[k], _SUB_ELEMS[k]) for k in _DTYPE_OBJ}
+
 
 def element_size(type_str: str) -> int:
     """Return byte size of one row for a DIALS type string."""
@@ -44,3 +55,17 @@ def numpy_shape(type_str: str, nrows: int) -> tuple:
     if sub is not None:
         return (nrows, sub)
     return (nrows,)
+
+
+def type_info(type_str: str) -> tuple:
+    """Return (numpy.dtype, element_size, sub_elements) for a DIALS type string.
+
+    A single lookup into a table of precomputed dtype objects, so callers
+    on the read path avoid re-parsing dtype strings. Requires numpy.
+    """
+    try:
+        return _TYPE_INFO[type_str]
+    except KeyError:
+        if np is None:
+            raise ImportError("numpy is required for type_info. Install with: pip install refl-index[numpy]") from None
+        raise ValueError(f"Unknown DIALS type: {type_str!r}") from None
@@ -1,23 +1,57 @@
 """ReflIndex: build, save, and load sidecar index for DIALS .refl files."""
 
+import copy
+import functools
+import hashlib
 import json
+import mmap
 import os
 import struct
-from dataclasses import dataclass
+import sys
+import zlib
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
 import msgpack
 
-from .dtypes import DIALS_TYPES, element_size
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Chunk size for draining binary blobs during indexing
+from .dtypes import _ELEM_SIZE
+
+# Chunk size for draining binary blobs in the streaming fallback scan
 _DRAIN_CHUNK = 1 * 1024 * 1024  # 1 MB
 
+_MAGIC = "dials::af::reflection_table"
+
+_MADV_RANDOM = getattr(mmap, "MADV_RANDOM", None)
+_MADV_SEQUENTIAL = getattr(mmap, "MADV_SEQUENTIAL", None)
+
+# Bytes hashed at each end of the .refl file for the cheap validate() check
+_SAMPLE_BYTES = 4096
+
+# Binary index layout (all integers little-endian):
+#   header   magic, version, num_type_strs, num_columns, meta_len, strings_len
+#   meta     JSON object with the scalar fields (refl_path, file_size, ...), plus
+#            json_crc (CRC32 of the JSON index) when written as a load sidecar
+#   strings  type strings then column names, UTF-8, NUL-separated
+#   arrays   type_idx (u16), elem_size, count, blob_offset, blob_size (i64), N each
+_BIN_MAGIC = b"REFLIDX\x00"
+_BIN_VERSION = 1
+_BIN_HEADER = struct.Struct("<8sHHIII8x")
 
-@dataclass
+# JSON index format versions that load() understands; save() writes the last
+_JSON_VERSIONS = (1, 2)
+
+
+@dataclass(slots=True, frozen=True)
 class ColumnInfo:
-    """Metadata for one column in a .refl file."""
+    """Metadata for one column in a .refl file (immutable and hashable)."""
     name: str
     type_str: str
     elem_size: int
@@ -26,168 +60,205 @@ class ColumnInfo:
     blob_size: int    # total bytes of raw data
 
 
+@dataclass(slots=True)
+class ValidationResult:
+    """Outcome of ReflIndex.validate; truthy when the file matches the index."""
+    ok: bool
+    reasons: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+
+@dataclass(slots=True)
+class _ColumnTable:
+    """Column metadata stored as parallel arrays (structure of arrays).
+
+    Numeric fields live in typed ``array.array`` buffers instead of one
+    Python object per column; ColumnInfo views are built on demand.
+    Names and type strings are interned, so lookups and comparisons
+    against them mostly resolve by identity.
+    """
+    names: list[str] = field(default_factory=list)
+    type_strs: list[str] = field(default_factory=list)  # distinct type strings
+    type_idx: array = field(default_factory=lambda: array("H"))
+    elem_size: array = field(default_factory=lambda: array("q"))
+    count: array = field(default_factory=lambda: array("q"))
+    blob_offset: array = field(default_factory=lambda: array("q"))
+    blob_size: array = field(default_factory=lambda: array("q"))
+    name_to_idx: dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_columns(cls, columns: list[ColumnInfo]) -> "_ColumnTable":
+        table = cls()
+        for c in columns:
+            table.append(c.name, c.type_str, c.elem_size, c.count, c.blob_offset, c.blob_size)
+        return table
+
+    def append(self, name: str, type_str: str, elem_size: int, count: int, blob_offset: int, blob_size: int):
+        try:
+            type_idx = self.type_strs.index(type_str)
+        except ValueError:
+            type_idx = len(self.type_strs)
+            self.type_strs.append(sys.intern(type_str))
+        name = sys.intern(name)
+        self.name_to_idx[name] = len(self.names)
+        self.names.append(name)
+        self.type_idx.append(type_idx)
+        self.elem_size.append(elem_size)
+        self.count.append(count)
+        self.blob_offset.append(blob_offset)
+        self.blob_size.append(blob_size)
+
+    def column(self, i: int) -> ColumnInfo:
+        return ColumnInfo(
+            name=self.names[i],
+            type_str=self.type_strs[self.type_idx[i]],
+            elem_size=self.elem_size[i],
+            count=self.count[i],
+            blob_offset=self.blob_offset[i],
+            blob_size=self.blob_size[i],
+        )
+
+
+class _ColumnsView(Sequence):
+    """Read-only sequence over a _ColumnTable that builds ColumnInfo per access."""
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table: _ColumnTable):
+        self._table = table
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._table.column(j) for j in range(*i.indices(len(self._table)))]
+        n = len(self._table)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("column index out of range")
+        return self._table.column(i)
+
+    def __eq__(self, other):
+        if not isinstance(other, (_ColumnsView, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class ReflIndex:
     """Sidecar index for a DIALS .refl msgpack file.
 
     Stores byte offsets of each column's binary blob, enabling O(1)
-    random access to any column or row range via file.seek().
+    random access to any column or row range. Column metadata is kept
+    as parallel arrays; ``columns`` and ``index[name]`` return
+    ColumnInfo views built on demand, and ``index[name]`` caches them.
     """
 
+    __slots__ = (
+        "refl_path", "file_size", "nrows", "num_identifiers", "byte_order",
+        "mtime_ns", "sample_crc", "column_digests", "_table", "_name_to_idx", "_col_cache",
+    )
+
     def __init__(
         self,
         refl_path: str,
         file_size: int,
         nrows: int,
         num_identifiers: int,
-        columns: list[ColumnInfo],
+        columns: "list[ColumnInfo] | _ColumnTable",
+        byte_order: str = "little",
+        mtime_ns: int | None = None,
+        sample_crc: int | None = None,
+        column_digests: list[str] | None = None,
     ):
+        if byte_order not in ("little", "big"):
+            raise ValueError(f"byte_order must be 'little' or 'big', got {byte_order!r}")
         self.refl_path = str(refl_path)
         self.file_size = file_size
         self.nrows = nrows
         self.num_identifiers = num_identifiers
-        self.columns = columns
-        self._column_map = {c.name: c for c in columns}
+        self.byte_order = byte_order  # byte order of the column blobs
+        self.mtime_ns = mtime_ns      # .refl modification time at build
+        self.sample_crc = sample_crc  # CRC32 of the file's first and last 4 KB
+        self.column_digests = column_digests  # per-column blob BLAKE2b hex digests, in column order
+        if not isinstance(columns, _ColumnTable):
+            columns = _ColumnTable.from_columns(columns)
+        self._table = columns
+        self._name_to_idx = columns.name_to_idx
+        self._col_cache: dict[str, ColumnInfo] = {}
 
     def __getitem__(self, name: str) -> ColumnInfo:
-        return self._column_map[name]
+        try:
+            return self._col_cache[name]
+        except KeyError:
+            col = self._col_cache[name] = self._table.column(self._name_to_idx[name])
+            return col
 
     def __contains__(self, name: str) -> bool:
-        return name in self._column_map
+        return name in self._name_to_idx
+
+    @property
+    def columns(self) -> Sequence[ColumnInfo]:
+        return _ColumnsView(self._table)
 
     @property
     def column_names(self) -> list[str]:
-        return [c.name for c in self.columns]
+        return list(self._table.names)
 
     @classmethod
-    def build(cls, refl_path: str | Path) -> "ReflIndex":
+    def build(
+        cls,
+        refl_path: str | Path,
+        *,
+        validate: bool = True,
+        checksums: bool = False,
+    ) -> "ReflIndex":
         """Build an index by scanning a .refl file.
 
-        Parses the msgpack structure to record byte offsets of each
-        column's binary blob. Binary blobs are drained in chunks to
-        avoid buffering hundreds of MB.
+        Memory-maps the file and walks the msgpack framing directly,
+        recording the byte offset of each column's binary blob and
+        jumping over it without reading its contents. Falls back to a
+        streaming msgpack.Unpacker scan if an unexpected tag appears.
+
+        With ``validate=False`` the per-column check that blob size equals
+        element size times row count is skipped; the index is still
+        correct for well-formed DIALS files.
+
+        With ``checksums=True`` a BLAKE2b digest of every column blob is
+        also recorded for ``validate(deep=True)``. This reads the whole file.
         """
         refl_path = Path(refl_path)
-        file_size = refl_path.stat().st_size
+        stat = refl_path.stat()
+        file_size = stat.st_size
+        if file_size == 0:
+            raise ValueError(f"Not a DIALS .refl file (empty): {refl_path}")
 
         with open(refl_path, "rb") as f:
-            unpacker = msgpack.Unpacker(
-                f,
-                raw=True,
-                strict_map_key=False,
-                max_bin_len=2**31 - 1,
-                max_buffer_size=2**31 - 1,
-                max_str_len=2**31 - 1,
-            )
-
-            # Outer array: [magic, version, data_map]
-            outer_len = unpacker.read_array_header()
-            if outer_len != 3:
-                raise ValueError(f"Expected outer array of length 3, got {outer_len}")
-
-            magic = unpacker.unpack()
-            if magic != b"dials::af::reflection_table":
-                raise ValueError(f"Not a DIALS .refl file (magic: {magic!r})")
-
-            version = unpacker.unpack()
-
-            # Main map: {"identifiers": ..., "nrows": ..., "data": ...}
-            main_map_len = unpacker.read_map_header()
-
-            nrows = 0
-            num_identifiers = 0
-            columns = []
-
-            for _ in range(main_map_len):
-                key = unpacker.unpack()
-                if isinstance(key, bytes):
-                    key = key.decode("utf-8")
-
-                if key == "nrows":
-                    nrows = unpacker.unpack()
-
-                elif key == "identifiers":
-                    # Skip all identifier entries without constructing them
-                    num_identifiers = unpacker.read_map_header()
-                    for _id in range(num_identifiers):
-                        unpacker.skip()  # key (int)
-                        unpacker.skip()  # value (uuid string)
-
-                elif key == "data":
-                    num_data_cols = unpacker.read_map_header()
-                    for _col in range(num_data_cols):
-                        col_name = unpacker.unpack()
-                        if isinstance(col_name, bytes):
-                            col_name = col_name.decode("utf-8")
-
-                        # Each column value is: [type_str, [count, raw_binary_blob]]
-                        unpacker.read_array_header()  # outer array (2)
-                        type_str = unpacker.unpack()
-                        if isinstance(type_str, bytes):
-                            type_str = type_str.decode("utf-8")
-
-                        unpacker.read_array_header()  # inner array (2)
-                        count = unpacker.unpack()
-
-                        # Now we need to read the binary blob header manually
-                        # to get the offset without buffering the entire blob.
-                        # The next item is a msgpack bin (0xC4/C5/C6).
-                        #
-                        # We use read_bytes(1) to get the bin marker, then
-                        # read the length bytes to determine blob size.
-                        # After that, tell() gives us the blob data offset.
-
-                        marker_byte = unpacker.read_bytes(1)
-                        marker = marker_byte[0]
-
-                        if marker == 0xC4:
-                            # bin8: 1 byte length
-                            length_bytes = unpacker.read_bytes(1)
-                            blob_size = length_bytes[0]
-                        elif marker == 0xC5:
-                            # bin16: 2 byte length (big-endian)
-                            length_bytes = unpacker.read_bytes(2)
-                            blob_size = struct.unpack(">H", length_bytes)[0]
-                        elif marker == 0xC6:
-                            # bin32: 4 byte length (big-endian)
-                            length_bytes = unpacker.read_bytes(4)
-                            blob_size = struct.unpack(">I", length_bytes)[0]
-                        else:
-                            raise ValueError(
-                                f"Expected bin marker for column {col_name!r}, "
-                                f"got 0x{marker:02x}"
-                            )
-
-                        blob_offset = unpacker.tell()
-
-                        # Verify size matches expectations
-                        if type_str in DIALS_TYPES:
-                            expected_size = element_size(type_str) * count
-                            if blob_size != expected_size:
-                                raise ValueError(
-                                    f"Column {col_name!r}: blob_size={blob_size} != "
-                                    f"element_size({element_size(type_str)}) * count({count}) = {expected_size}"
-                                )
-
-                        # Drain the blob in chunks to avoid buffering it all
-                        remaining = blob_size
-                        while remaining > 0:
-                            chunk = min(_DRAIN_CHUNK, remaining)
-                            unpacker.read_bytes(chunk)
-                            remaining -= chunk
-
-                        elem_sz = element_size(type_str) if type_str in DIALS_TYPES else 0
-                        columns.append(ColumnInfo(
-                            name=col_name,
-                            type_str=type_str,
-                            elem_size=elem_sz,
-                            count=count,
-                            blob_offset=blob_offset,
-                            blob_size=blob_size,
-                        ))
-
-                else:
-                    # Unknown key — skip its value
-                    unpacker.skip()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if _MADV_RANDOM is not None:
+                    # Only framing bytes are touched; readahead would pull in skipped blobs
+                    mm.madvise(_MADV_RANDOM)
+                sample_crc = _sample_crc(mm)
+                try:
+                    nrows, num_identifiers, columns = _scan_mmap(mm, validate)
+                except _UnexpectedTag:
+                    f.seek(0)
+                    _fadvise(f, file_size, "POSIX_FADV_SEQUENTIAL")
+                    try:
+                        nrows, num_identifiers, columns = _scan_unpacker(f, validate)
+                    finally:
+                        # Drained blob pages are of no further use to the scan
+                        _fadvise(f, file_size, "POSIX_FADV_DONTNEED")
+                column_digests = _column_digests(mm, columns) if checksums else None
 
         return cls(
             refl_path=str(refl_path),
@@ -195,74 +266,147 @@ class ReflIndex:
             nrows=nrows,
             num_identifiers=num_identifiers,
             columns=columns,
+            byte_order="little",  # DIALS always writes little-endian blobs
+            mtime_ns=stat.st_mtime_ns,
+            sample_crc=sample_crc,
+            column_digests=column_digests,
         )
 
-    def save(self, path: str | Path | None = None) -> Path:
+    def save(
+        self,
+        path: str | Path | None = None,
+        indent: bool = False,
+        format: str = "json",
+    ) -> Path:
         """Save index as a JSON sidecar file.
 
-        Defaults to ``<refl_path>.idx``.
+        Defaults to ``<refl_path>.idx``. A binary copy is also written to
+        ``<path>.bin`` (see ``save_binary``) so that ``load`` can skip JSON
+        parsing; the JSON file remains the canonical, human-readable format.
+        The copy records a CRC32 of the JSON it was written with.
+
+        JSON is written compactly unless ``indent`` is set, and with
+        orjson when it is installed. With ``format="binary"`` the index
+        file itself is written in the binary layout and no sidecar is
+        written; ``load`` recognizes either.
         """
+        if format not in ("json", "binary"):
+            raise ValueError(f"format must be 'json' or 'binary', got {format!r}")
         if path is None:
             path = Path(self.refl_path + ".idx")
         else:
             path = Path(path)
+        if format == "binary":
+            return self.save_binary(path)
+
+        table = self._table
 
         # String table for type_str deduplication
-        type_strs = sorted(set(c.type_str for c in self.columns))
-        type_str_to_idx = {t: i for i, t in enumerate(type_strs)}
+        type_strs = sorted(table.type_strs)
+        remap = [type_strs.index(t) for t in table.type_strs]
 
         # Columns as compact arrays
-        col_entries = []
-        for c in self.columns:
-            col_entries.append([
-                c.name,
-                type_str_to_idx[c.type_str],
-                c.elem_size,
-                c.count,
-                c.blob_offset,
-                c.blob_size,
-            ])
+        col_entries = [
+            [name, remap[type_idx], elem_sz, count, blob_offset, blob_size]
+            for name, type_idx, elem_sz, count, blob_offset, blob_size in zip(
+                table.names, table.type_idx, table.elem_size,
+                table.count, table.blob_offset, table.blob_size,
+            )
+        ]
 
         doc = {
-            "version": 1,
+            "version": _JSON_VERSIONS[-1],
             "refl_path": self.refl_path,
             "file_size": self.file_size,
             "created_at": datetime.now(timezone.utc).isoformat(),
             "nrows": self.nrows,
             "num_identifiers": self.num_identifiers,
-            "num_columns": len(self.columns),
+            "byte_order": self.byte_order,
+            "mtime_ns": self.mtime_ns,
+            "sample_crc": self.sample_crc,
+            "column_digests": self.column_digests,
+            "num_columns": len(table),
             "string_tables": {"type_strs": type_strs},
             "columns": col_entries,
+            "name_index": table.name_to_idx,
         }
 
-        with open(path, "w") as f:
-            json.dump(doc, f, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(doc, option=orjson.OPT_INDENT_2 if indent else 0)
+        else:
+            data = json.dumps(
+                doc, indent=2 if indent else None, separators=None if indent else (",", ":"),
+            ).encode("utf-8")
+        path.write_bytes(data)
+
+        self._write_binary(_binary_path(path), json_crc=zlib.crc32(data))
 
         return path
 
     @classmethod
     def load(cls, path: str | Path) -> "ReflIndex":
-        """Load an index from a JSON sidecar file."""
+        """Load an index from a JSON or binary index file.
+
+        Binary index files are recognized by their magic bytes. For JSON
+        files, uses the binary copy written by ``save`` when the JSON CRC32
+        it records matches the JSON on disk, falling back to parsing the
+        JSON otherwise.
+
+        Parsed indices are memoized by the path, mtime and size of both
+        the index and its binary copy, so reopening an unchanged index
+        skips parsing. Each call returns its own copy, so changes to one
+        loaded index never reach later loads.
+        """
         path = Path(path)
-        with open(path) as f:
-            doc = json.load(f)
+        st = path.stat()
+        try:
+            bin_st = _binary_path(path).stat()
+            sidecar = (bin_st.st_mtime_ns, bin_st.st_size)
+        except OSError:
+            sidecar = None
+        index = copy.copy(_load_cached(cls, str(path.resolve()), st.st_mtime_ns, st.st_size, sidecar))
+        # The column table has no mutating API and stays shared; per-index
+        # mutable state does not
+        index._col_cache = {}
+        if index.column_digests is not None:
+            index.column_digests = list(index.column_digests)
+        return index
 
-        if doc.get("version") != 1:
+    @classmethod
+    def _load_file(cls, path: Path) -> "ReflIndex":
+        data = path.read_bytes()
+        if data[:len(_BIN_MAGIC)] == _BIN_MAGIC:
+            return cls.load_binary(path)
+
+        # Only trust a sidecar written alongside exactly this JSON; mtimes
+        # are not enough, since copies can carry an older one
+        try:
+            return cls._read_binary(_binary_path(path), json_crc=zlib.crc32(data))
+        except (OSError, ValueError):
+            pass
+
+        doc = orjson.loads(data) if orjson is not None else json.loads(data)
+
+        if doc.get("version") not in _JSON_VERSIONS:
             raise ValueError(f"Unsupported index version: {doc.get('version')}")
 
-        type_strs = doc["string_tables"]["type_strs"]
-
-        columns = []
-        for entry in doc["columns"]:
-            name, type_idx, elem_sz, count, blob_offset, blob_size = entry
-            columns.append(ColumnInfo(
-                name=name,
-                type_str=type_strs[type_idx],
-                elem_size=elem_sz,
-                count=count,
-                blob_offset=blob_offset,
-                blob_size=blob_size,
-            ))
+        # Transpose the row lists once and bulk-fill each array
+        fields = list(zip(*doc["columns"])) or [()] * 6
+        columns = _ColumnTable(
+            names=[sys.intern(n) for n in fields[0]],
+            type_strs=[sys.intern(t) for t in doc["string_tables"]["type_strs"]],
+            type_idx=array("H", fields[1]),
+            elem_size=array("q", fields[2]),
+            count=array("q", fields[3]),
+            blob_offset=array("q", fields[4]),
+            blob_size=array("q", fields[5]),
+        )
+
+        # Version 1 indices predate the stored name -> position map
+        if "name_index" in doc:
+            columns.name_to_idx = {sys.intern(k): i for k, i in doc["name_index"].items()}
+        else:
+            columns.name_to_idx = {name: i for i, name in enumerate(columns.names)}
 
         return cls(
             refl_path=doc["refl_path"],
@@ -270,11 +414,546 @@ class ReflIndex:
             nrows=doc["nrows"],
             num_identifiers=doc["num_identifiers"],
             columns=columns,
+            byte_order=doc.get("byte_order", "little"),
+            mtime_ns=doc.get("mtime_ns"),
+            sample_crc=doc.get("sample_crc"),
+            column_digests=doc.get("column_digests"),
+        )
+
+    def save_binary(self, path: str | Path) -> Path:
+        """Save index in the fixed binary layout read by ``load_binary``.
+
+        Column fields are stored as contiguous little-endian arrays, so
+        loading costs a handful of bulk copies regardless of column count.
+        """
+        return self._write_binary(Path(path))
+
+    def _write_binary(self, path: Path, json_crc: int | None = None) -> Path:
+        table = self._table
+        if any("\0" in s for s in table.type_strs) or any("\0" in s for s in table.names):
+            raise ValueError("Column names and type strings must not contain NUL characters")
+
+        meta = json.dumps({
+            "refl_path": self.refl_path,
+            "file_size": self.file_size,
+            "nrows": self.nrows,
+            "num_identifiers": self.num_identifiers,
+            "byte_order": self.byte_order,
+            "mtime_ns": self.mtime_ns,
+            "sample_crc": self.sample_crc,
+            "column_digests": self.column_digests,
+            "json_crc": json_crc,
+        }, separators=(",", ":")).encode("utf-8")
+        strings = "\0".join(table.type_strs + table.names).encode("utf-8")
+
+        with open(path, "wb") as f:
+            f.write(_BIN_HEADER.pack(
+                _BIN_MAGIC, _BIN_VERSION, len(table.type_strs), len(table), len(meta), len(strings),
+            ))
+            f.write(meta)
+            f.write(strings)
+            for arr in (table.type_idx, table.elem_size, table.count, table.blob_offset, table.blob_size):
+                if sys.byteorder != "little":
+                    arr = array(arr.typecode, arr)
+                    arr.byteswap()
+                f.write(arr.tobytes())
+
+        return path
+
+    @classmethod
+    def load_binary(cls, path: str | Path) -> "ReflIndex":
+        """Load an index written by ``save_binary``."""
+        return cls._read_binary(Path(path))
+
+    @classmethod
+    def _read_binary(cls, path: Path, json_crc: int | None = None) -> "ReflIndex":
+        """Parse a binary index, requiring a matching ``json_crc`` if given."""
+        data = memoryview(path.read_bytes())
+        if len(data) < _BIN_HEADER.size:
+            raise ValueError(f"Not a binary refl index (too short): {path}")
+        magic, version, num_types, num_columns, meta_len, strings_len = _BIN_HEADER.unpack_from(data)
+        if magic != _BIN_MAGIC:
+            raise ValueError(f"Not a binary refl index (magic: {magic!r})")
+        if version != _BIN_VERSION:
+            raise ValueError(f"Unsupported binary index version: {version}")
+
+        pos = _BIN_HEADER.size
+        meta = json.loads(bytes(data[pos:pos + meta_len]))
+        if json_crc is not None and meta.get("json_crc") != json_crc:
+            raise ValueError(f"Binary index was not written with this JSON index: {path}")
+        pos += meta_len
+        strings = str(data[pos:pos + strings_len], "utf-8").split("\0") if strings_len else []
+        pos += strings_len
+        if len(strings) != num_types + num_columns:
+            raise ValueError(f"Corrupt binary index string table: {path}")
+
+        strings = [sys.intern(t) for t in strings]
+        names = strings[num_types:]
+        columns = _ColumnTable(
+            names=names,
+            type_strs=strings[:num_types],
+            name_to_idx=dict(zip(names, range(num_columns))),
+        )
+        for arr in (columns.type_idx, columns.elem_size, columns.count, columns.blob_offset, columns.blob_size):
+            nbytes = num_columns * arr.itemsize
+            if pos + nbytes > len(data):
+                raise ValueError(f"Truncated binary index: {path}")
+            arr.frombytes(data[pos:pos + nbytes])
+            if sys.byteorder != "little":
+                arr.byteswap()
+            pos += nbytes
+
+        return cls(
+            refl_path=meta["refl_path"],
+            file_size=meta["file_size"],
+            nrows=meta["nrows"],
+            num_identifiers=meta["num_identifiers"],
+            columns=columns,
+            byte_order=meta["byte_order"],
+            mtime_ns=meta.get("mtime_ns"),
+            sample_crc=meta.get("sample_crc"),
+            column_digests=meta.get("column_digests"),
         )
 
-    def validate(self, refl_path: str | Path | None = None) -> bool:
-        """Check that the indexed .refl file exists and matches expected size."""
+    def validate(self, refl_path: str | Path | None = None, *, deep: bool = False) -> ValidationResult:
+        """Check that the indexed .refl file exists and still matches the index.
+
+        Compares the file size and, when recorded at build time, the
+        modification time and a CRC32 of the first and last 4 KB. Reads
+        at most 8 KB regardless of file size. The result is truthy when
+        all checks pass; ``reasons`` lists any that failed.
+
+        The mtime check applies only to the indexed path itself: a
+        relocated or copied file passed as ``refl_path`` is checked by
+        size and CRC alone.
+
+        With ``deep=True`` every column blob is also checked against the
+        digests recorded by ``build(checksums=True)``, in one sequential
+        pass over the file. Raises ValueError if the index has no digests.
+        """
+        if deep and self.column_digests is None:
+            raise ValueError("Index has no column digests; build it with checksums=True to use deep=True")
         path = Path(refl_path) if refl_path else Path(self.refl_path)
         if not path.exists():
-            return False
-        return path.stat().st_size == self.file_size
+            return ValidationResult(False, [f"file not found: {path}"])
+
+        stat = path.stat()
+        reasons = []
+        if stat.st_size != self.file_size:
+            reasons.append(f"size {stat.st_size} != indexed {self.file_size}")
+            return ValidationResult(False, reasons)
+        same_file = refl_path is None or path.resolve() == Path(self.refl_path).resolve()
+        if same_file and self.mtime_ns is not None and stat.st_mtime_ns != self.mtime_ns:
+            reasons.append(f"mtime_ns {stat.st_mtime_ns} != indexed {self.mtime_ns}")
+        if (self.sample_crc is not None or deep) and stat.st_size > 0:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if self.sample_crc is not None:
+                    crc = _sample_crc(mm)
+                    if crc != self.sample_crc:
+                        reasons.append(f"head/tail CRC32 {crc:#010x} != indexed {self.sample_crc:#010x}")
+                if deep:
+                    table = self._table
+                    for i, (digest, expected) in enumerate(zip(_column_digests(mm, table), self.column_digests)):
+                        if digest != expected:
+                            reasons.append(f"column {table.names[i]!r}: digest {digest} != indexed {expected}")
+        return ValidationResult(not reasons, reasons)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_cached(cls, path: str, mtime_ns: int, size: int, sidecar: tuple | None) -> ReflIndex:
+    # The stat fields only key the cache, so a rewritten index or sidecar misses
+    return cls._load_file(Path(path))
+
+
+def _sample_crc(buf) -> int:
+    """CRC32 over the first and last _SAMPLE_BYTES of a buffer."""
+    return zlib.crc32(buf[-_SAMPLE_BYTES:], zlib.crc32(buf[:_SAMPLE_BYTES]))
+
+
+def _column_digests(mm: mmap.mmap, table: _ColumnTable) -> list[str]:
+    """BLAKE2b-128 hex digest of each column blob, read in file order.
+
+    Hashes memoryview slices of the mapping, so no blob is copied; hashlib
+    releases the GIL while hashing large buffers.
+    """
+    if _MADV_SEQUENTIAL is not None:
+        mm.madvise(_MADV_SEQUENTIAL)
+    blob_offset, blob_size = table.blob_offset, table.blob_size
+    digests = [""] * len(table)
+    with memoryview(mm) as view:
+        for i in sorted(range(len(table)), key=blob_offset.__getitem__):
+            off = blob_offset[i]
+            digests[i] = hashlib.blake2b(view[off:off + blob_size[i]], digest_size=16).hexdigest()
+    return digests
+
+
+def _fadvise(f, length: int, advice: str):
+    """Give the kernel an access-pattern hint for a file (no-op where unsupported)."""
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, length, getattr(os, advice))
+
+
+def _binary_path(path: Path) -> Path:
+    """Path of the binary sidecar stored next to a JSON index."""
+    return path.with_suffix(path.suffix + ".bin")
+
+
+class _UnexpectedTag(ValueError):
+    """Raised by _MsgpackScanner on a msgpack tag it does not handle."""
+
+
+# Width in bytes of the length/size prefix for each msgpack tag that has one
+_FIXED_PAYLOAD = {
+    0xCC: 1, 0xCD: 2, 0xCE: 4, 0xCF: 8,  # uint 8/16/32/64
+    0xD0: 1, 0xD1: 2, 0xD2: 4, 0xD3: 8,  # int 8/16/32/64
+    0xCA: 4, 0xCB: 8,                    # float 32/64
+    0xD4: 2, 0xD5: 3, 0xD6: 5, 0xD7: 9, 0xD8: 17,  # fixext (type byte + data)
+}
+_LENGTH_PREFIXED = {
+    0xC4: 1, 0xC5: 2, 0xC6: 4,  # bin 8/16/32
+    0xD9: 1, 0xDA: 2, 0xDB: 4,  # str 8/16/32
+}
+_EXT_PREFIXED = {0xC7: 1, 0xC8: 2, 0xC9: 4}  # ext 8/16/32 (length, then type byte)
+_ARRAY_PREFIXED = {0xDC: 2, 0xDD: 4}
+_MAP_PREFIXED = {0xDE: 2, 0xDF: 4}
+
+# Precompiled big-endian unpackers, keyed by width in bytes
+_U16_UNPACK = struct.Struct(">H").unpack_from
+_U32_UNPACK = struct.Struct(">I").unpack_from
+_UINT_UNPACK = {1: struct.Struct(">B").unpack_from, 2: _U16_UNPACK, 4: _U32_UNPACK, 8: struct.Struct(">Q").unpack_from}
+_INT_UNPACK = {w: struct.Struct(">" + c).unpack_from for w, c in ((1, "b"), (2, "h"), (4, "i"), (8, "q"))}
+_FLOAT_UNPACK = {4: struct.Struct(">f").unpack_from, 8: struct.Struct(">d").unpack_from}
+
+
+class _MsgpackScanner:
+    """Minimal msgpack cursor over an in-memory buffer (e.g. an mmap).
+
+    Decodes only the scalar and header types that make up the framing of
+    a .refl file, and can skip any value by advancing ``pos`` without
+    copying its payload.
+    """
+
+    __slots__ = ("buf", "pos")
+
+    def __init__(self, buf):
+        self.buf = buf
+        self.pos = 0
+
+    def _advance(self, n: int) -> int:
+        """Advance the cursor by n bytes, returning the old position."""
+        pos = self.pos
+        if pos + n > len(self.buf):
+            raise ValueError(f"Truncated .refl file: need {n} bytes at offset {pos}")
+        self.pos = pos + n
+        return pos
+
+    def _read_uint(self, width: int) -> int:
+        return _UINT_UNPACK[width](self.buf, self._advance(width))[0]
+
+    def _read_tag(self) -> int:
+        return self.buf[self._advance(1)]
+
+    def read_array_header(self) -> int:
+        tag = self._read_tag()
+        if 0x90 <= tag <= 0x9F:
+            return tag & 0x0F
+        if tag in _ARRAY_PREFIXED:
+            return self._read_uint(_ARRAY_PREFIXED[tag])
+        raise _UnexpectedTag(f"Expected array at offset {self.pos - 1}, got 0x{tag:02x}")
+
+    def read_map_header(self) -> int:
+        tag = self._read_tag()
+        if 0x80 <= tag <= 0x8F:
+            return tag & 0x0F
+        if tag in _MAP_PREFIXED:
+            return self._read_uint(_MAP_PREFIXED[tag])
+        raise _UnexpectedTag(f"Expected map at offset {self.pos - 1}, got 0x{tag:02x}")
+
+    def read_bin_header(self) -> int:
+        """Consume a bin marker and its length, returning the blob size."""
+        tag = self._read_tag()
+        if tag == 0xC6:
+            return _U32_UNPACK(self.buf, self._advance(4))[0]
+        if tag == 0xC5:
+            return _U16_UNPACK(self.buf, self._advance(2))[0]
+        if tag == 0xC4:
+            return self.buf[self._advance(1)]
+        raise _UnexpectedTag(f"Expected bin marker, got 0x{tag:02x}")
+
+    def unpack(self):
+        """Decode one scalar value (int, float, bool, nil, str or bin)."""
+        tag = self._read_tag()
+        if tag <= 0x7F:
+            return tag
+        if tag >= 0xE0:
+            return tag - 0x100
+        if 0xA0 <= tag <= 0xBF:
+            n = tag & 0x1F
+            pos = self._advance(n)
+            return bytes(self.buf[pos:pos + n]).decode("utf-8")
+        if tag == 0xC0:
+            return None
+        if tag in (0xC2, 0xC3):
+            return tag == 0xC3
+        if 0xCC <= tag <= 0xCF:
+            return self._read_uint(_FIXED_PAYLOAD[tag])
+        if 0xD0 <= tag <= 0xD3:
+            width = _FIXED_PAYLOAD[tag]
+            return _INT_UNPACK[width](self.buf, self._advance(width))[0]
+        if tag in (0xCA, 0xCB):
+            width = _FIXED_PAYLOAD[tag]
+            return _FLOAT_UNPACK[width](self.buf, self._advance(width))[0]
+        if tag in _LENGTH_PREFIXED:
+            n = self._read_uint(_LENGTH_PREFIXED[tag])
+            pos = self._advance(n)
+            raw = bytes(self.buf[pos:pos + n])
+            return raw if tag <= 0xC6 else raw.decode("utf-8")
+        raise _UnexpectedTag(f"Cannot decode tag 0x{tag:02x} at offset {self.pos - 1}")
+
+    def skip_int_str_pairs(self, n: int):
+        """Skip n (int key, str value) map entries, e.g. the identifiers table.
+
+        Unsigned int keys and fixstr/str8 values (36-char UUIDs are str8)
+        are stepped over inline; any other encoding goes through skip().
+        """
+        buf = self.buf
+        pos = self.pos
+        try:
+            for _ in range(n):
+                tag = buf[pos]
+                if tag <= 0x7F:
+                    pos += 1
+                elif 0xCC <= tag <= 0xCF:
+                    pos += 1 + _FIXED_PAYLOAD[tag]
+                else:
+                    self.pos = pos
+                    self.skip()
+                    pos = self.pos
+
+                tag = buf[pos]
+                if 0xA0 <= tag <= 0xBF:
+                    pos += 1 + (tag & 0x1F)
+                elif tag == 0xD9:
+                    pos += 2 + buf[pos + 1]
+                else:
+                    self.pos = pos
+                    self.skip()
+                    pos = self.pos
+        except IndexError:
+            pos = len(buf) + 1
+        if pos > len(buf):
+            raise ValueError(f"Truncated .refl file while skipping {n} map entries at offset {self.pos}")
+        self.pos = pos
+
+    def skip(self):
+        """Skip one complete value (including nested containers)."""
+        pending = 1
+        while pending:
+            pending -= 1
+            tag = self._read_tag()
+            if tag <= 0x7F or tag >= 0xE0 or tag in (0xC0, 0xC2, 0xC3):
+                continue
+            if tag <= 0x8F:
+                pending += 2 * (tag & 0x0F)
+            elif tag <= 0x9F:
+                pending += tag & 0x0F
+            elif tag <= 0xBF:
+                self._advance(tag & 0x1F)
+            elif tag in _FIXED_PAYLOAD:
+                self._advance(_FIXED_PAYLOAD[tag])
+            elif tag in _LENGTH_PREFIXED:
+                self._advance(self._read_uint(_LENGTH_PREFIXED[tag]))
+            elif tag in _EXT_PREFIXED:
+                self._advance(self._read_uint(_EXT_PREFIXED[tag]) + 1)
+            elif tag in _ARRAY_PREFIXED:
+                pending += self._read_uint(_ARRAY_PREFIXED[tag])
+            elif tag in _MAP_PREFIXED:
+                pending += 2 * self._read_uint(_MAP_PREFIXED[tag])
+            else:
+                raise _UnexpectedTag(f"Invalid msgpack tag 0x{tag:02x} at offset {self.pos - 1}")
+
+
+def _add_column(
+    columns: _ColumnTable, col_name: str, type_str: str, count: int, blob_offset: int, blob_size: int,
+    validate: bool = True,
+):
+    """Append a column to the table, optionally checking its blob size against its type."""
+    elem_sz = _ELEM_SIZE.get(type_str, 0)
+    if validate and elem_sz and blob_size != elem_sz * count:
+        raise ValueError(
+            f"Column {col_name!r}: blob_size={blob_size} != "
+            f"element_size({elem_sz}) * count({count}) = {elem_sz * count}"
+        )
+    columns.append(col_name, type_str, elem_sz, count, blob_offset, blob_size)
+
+
+def _scan_mmap(buf, validate: bool = True) -> tuple[int, int, _ColumnTable]:
+    """Scan .refl framing in an mmap, skipping blobs by offset arithmetic.
+
+    Returns (nrows, num_identifiers, columns).
+    """
+    scanner = _MsgpackScanner(buf)
+
+    # Outer array: [magic, version, data_map]
+    outer_len = scanner.read_array_header()
+    if outer_len != 3:
+        raise ValueError(f"Expected outer array of length 3, got {outer_len}")
+
+    magic = scanner.unpack()
+    if magic not in (_MAGIC, _MAGIC.encode()):
+        raise ValueError(f"Not a DIALS .refl file (magic: {magic!r})")
+
+    version = scanner.unpack()
+
+    # Main map: {"identifiers": ..., "nrows": ..., "data": ...}
+    main_map_len = scanner.read_map_header()
+
+    nrows = 0
+    num_identifiers = 0
+    columns = _ColumnTable()
+
+    for _ in range(main_map_len):
+        key = scanner.unpack()
+
+        if key == "nrows":
+            nrows = scanner.unpack()
+
+        elif key == "identifiers":
+            num_identifiers = scanner.read_map_header()
+            scanner.skip_int_str_pairs(num_identifiers)
+
+        elif key == "data":
+            # Bind hot methods once for the per-column loop
+            unpack = scanner.unpack
+            read_array_header = scanner.read_array_header
+            read_bin_header = scanner.read_bin_header
+            advance = scanner._advance
+
+            num_data_cols = scanner.read_map_header()
+            for _col in range(num_data_cols):
+                col_name = unpack()
+
+                # Each column value is: [type_str, [count, raw_binary_blob]]
+                read_array_header()  # outer array (2)
+                type_str = unpack()
+                read_array_header()  # inner array (2)
+                count = unpack()
+
+                blob_size = read_bin_header()
+                blob_offset = scanner.pos
+                _add_column(columns, col_name, type_str, count, blob_offset, blob_size, validate)
+
+                # Jump over the blob without touching its pages
+                advance(blob_size)
+
+        else:
+            # Unknown key — skip its value
+            scanner.skip()
+
+    return nrows, num_identifiers, columns
+
+
+def _scan_unpacker(f, validate: bool = True) -> tuple[int, int, _ColumnTable]:
+    """Scan .refl framing with a streaming msgpack.Unpacker.
+
+    Slower fallback for _scan_mmap: binary blobs are drained in chunks to
+    avoid buffering hundreds of MB. Returns (nrows, num_identifiers, columns).
+    """
+    unpacker = msgpack.Unpacker(
+        f,
+        raw=False,
+        strict_map_key=False,
+        max_bin_len=2**31 - 1,
+        max_buffer_size=2**31 - 1,
+        max_str_len=2**31 - 1,
+    )
+
+    # Outer array: [magic, version, data_map]
+    outer_len = unpacker.read_array_header()
+    if outer_len != 3:
+        raise ValueError(f"Expected outer array of length 3, got {outer_len}")
+
+    # The magic may be packed as bin (stays bytes) or str (decoded by the unpacker)
+    magic = unpacker.unpack()
+    if magic not in (_MAGIC, _MAGIC.encode()):
+        raise ValueError(f"Not a DIALS .refl file (magic: {magic!r})")
+
+    version = unpacker.unpack()
+
+    # Main map: {"identifiers": ..., "nrows": ..., "data": ...}
+    main_map_len = unpacker.read_map_header()
+
+    nrows = 0
+    num_identifiers = 0
+    columns = _ColumnTable()
+
+    for _ in range(main_map_len):
+        key = unpacker.unpack()
+
+        if key == "nrows":
+            nrows = unpacker.unpack()
+
+        elif key == "identifiers":
+            # Skip all identifier entries without constructing them
+            num_identifiers = unpacker.read_map_header()
+            for _id in range(num_identifiers):
+                unpacker.skip()  # key (int)
+                unpacker.skip()  # value (uuid string)
+
+        elif key == "data":
+            # Bind hot methods once for the per-column loop
+            unpack = unpacker.unpack
+            read_array_header = unpacker.read_array_header
+            read_bytes = unpacker.read_bytes
+            tell = unpacker.tell
+
+            num_data_cols = unpacker.read_map_header()
+            for _col in range(num_data_cols):
+                col_name = unpack()
+
+                # Each column value is: [type_str, [count, raw_binary_blob]]
+                read_array_header()  # outer array (2)
+                type_str = unpack()
+                read_array_header()  # inner array (2)
+                count = unpack()
+
+                # Now we need to read the binary blob header manually
+                # to get the offset without buffering the entire blob.
+                # The next item is a msgpack bin (0xC4/C5/C6).
+                #
+                # We use read_bytes(1) to get the bin marker, then
+                # read the length bytes to determine blob size.
+                # After that, tell() gives us the blob data offset.
+
+                marker = read_bytes(1)[0]
+
+                if marker == 0xC4:
+                    # bin8: 1 byte length
+                    blob_size = read_bytes(1)[0]
+                elif marker == 0xC5:
+                    # bin16: 2 byte length (big-endian)
+                    blob_size = _U16_UNPACK(read_bytes(2))[0]
+                elif marker == 0xC6:
+                    # bin32: 4 byte length (big-endian)
+                    blob_size = _U32_UNPACK(read_bytes(4))[0]
+                else:
+                    raise ValueError(
+                        f"Expected bin marker for column {col_name!r}, "
+                        f"got 0x{marker:02x}"
+                    )
+
+                blob_offset = tell()
+                _add_column(columns, col_name, type_str, count, blob_offset, blob_size, validate)
+
+                # Drain the blob in chunks to avoid buffering it all
+                remaining = blob_size
+                while remaining > 0:
+                    chunk = min(_DRAIN_CHUNK, remaining)
+                    read_bytes(chunk)
+                    remaining -= chunk
+
+        else:
+            # Unknown key — skip its value
+            unpacker.skip()
+
+    return nrows, num_identifiers, columns
@@ -128,3 +128,11 @@ def synthetic_refl_small(tmp_path):
     path = tmp_path / "small.refl"
     col_arrays = make_synthetic_refl(path, nrows=10)
     return path, col_arrays
+
+
+@pytest.fixture
+def synthetic_refl_large(tmp_path):
+    """Create a synthetic .refl file whose blobs need bin32 length headers."""
+    path = tmp_path / "large.refl"
+    col_arrays = make_synthetic_refl(path, nrows=10_000)
+    return path, col_arrays
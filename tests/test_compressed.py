@@ -0,0 +1,128 @@
+"""Tests for refl_index.compressed."""
+
+import os
+
+import numpy as np
+import pytest
+
+from refl_index import compressed
+from refl_index.compressed import CompressedReader, write_compressed
+from refl_index.indexer import ColumnInfo, ReflIndex
+
+CODECS = ["zlib", pytest.param("blosc2", marks=pytest.mark.skipif(compressed.blosc2 is None, reason="blosc2 not installed"))]
+
+
+class TestRoundtrip:
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_full_columns(self, synthetic_refl, codec):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+
+        blz_path = write_compressed(index, codec=codec)
+        assert blz_path.name == path.name + ".blz"
+
+        with CompressedReader(blz_path) as reader:
+            assert reader.codec == codec
+            assert reader.column_names == index.column_names
+            for name, expected in col_arrays.items():
+                arr = reader.read_column(name)
+                assert arr.dtype == expected.dtype
+                np.testing.assert_array_equal(arr, expected)
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_slices_across_chunks(self, synthetic_refl_large, tmp_path, codec):
+        path, col_arrays = synthetic_refl_large
+        index = ReflIndex.build(path)
+
+        # Small chunks so slices start and end mid-chunk and span several
+        blz_path = write_compressed(index, tmp_path / "large.refl.blz", codec=codec, chunk_bytes=1000)
+        with CompressedReader(blz_path) as reader:
+            for start, stop in [(0, 1), (37, 4321), (500, 500), (9000, 10_000)]:
+                result = reader.read_columns(["miller_index", "is_strong"], start, stop)
+                for name, arr in result.items():
+                    np.testing.assert_array_equal(arr, col_arrays[name][start:stop])
+
+    def test_compresses_integer_columns(self, synthetic_refl_large, tmp_path):
+        path, _ = synthetic_refl_large
+        index = ReflIndex.build(path)
+        blz_path = write_compressed(index, tmp_path / "large.refl.blz", codec="zlib")
+        with CompressedReader(blz_path) as reader:
+            for name in ("flags", "imageset_id", "is_strong"):
+                stored = sum(csize for _, csize in reader._columns[name].chunks)
+                assert stored < index[name].blob_size / 2
+
+    def test_big_endian_blobs_are_swapped(self, synthetic_refl, tmp_path):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+
+        data = bytearray(path.read_bytes())
+        for col in index.columns:
+            swapped = col_arrays[col.name].byteswap().tobytes()
+            data[col.blob_offset:col.blob_offset + col.blob_size] = swapped
+        be_path = tmp_path / "big.refl"
+        be_path.write_bytes(bytes(data))
+        be_index = ReflIndex(
+            refl_path=str(be_path),
+            file_size=index.file_size,
+            nrows=index.nrows,
+            num_identifiers=index.num_identifiers,
+            columns=index.columns,
+            byte_order="big",
+        )
+
+        with CompressedReader(write_compressed(be_index, codec="zlib")) as reader:
+            for name, expected in col_arrays.items():
+                np.testing.assert_array_equal(reader.read_column(name, 3, 9), expected[3:9])
+
+    def test_unknown_type_columns_are_skipped(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+
+        # Indexed but not decodable, like a std::string column
+        flags = index["flags"]
+        columns = list(index.columns) + [
+            ColumnInfo("names", "std::string", 0, index.nrows, flags.blob_offset, flags.blob_size),
+        ]
+        with_unknown = ReflIndex(
+            refl_path=index.refl_path,
+            file_size=index.file_size,
+            nrows=index.nrows,
+            num_identifiers=index.num_identifiers,
+            columns=columns,
+        )
+
+        with CompressedReader(write_compressed(with_unknown, codec="zlib")) as reader:
+            assert "names" not in reader
+            assert reader.column_names == index.column_names
+            np.testing.assert_array_equal(reader.read_column("flags"), col_arrays["flags"])
+
+
+class TestErrors:
+    def test_missing_column(self, synthetic_refl):
+        path, _ = synthetic_refl
+        with CompressedReader(write_compressed(ReflIndex.build(path), codec="zlib")) as reader:
+            with pytest.raises(KeyError, match="nonexistent"):
+                reader.read_column("nonexistent")
+            with pytest.raises(IndexError, match="exceeds row count"):
+                reader.read_column("flags", stop=101)
+        with pytest.raises(ValueError, match="closed"):
+            reader.read_column("flags")
+
+    def test_del_releases_fd(self, synthetic_refl):
+        path, _ = synthetic_refl
+        reader = CompressedReader(write_compressed(ReflIndex.build(path), codec="zlib"))
+        fd = reader._fd
+        del reader
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+    def test_bad_magic(self, tmp_path):
+        bad = tmp_path / "bad.blz"
+        bad.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError, match="magic"):
+            CompressedReader(bad)
+
+    def test_unknown_codec(self, synthetic_refl):
+        path, _ = synthetic_refl
+        with pytest.raises(ValueError, match="codec"):
+            write_compressed(ReflIndex.build(path), codec="lzma")
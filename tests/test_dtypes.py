@@ -8,6 +8,7 @@ from refl_index.dtypes import (
     element_size,
     numpy_dtype,
     numpy_shape,
+    type_info,
 )
 
 
@@ -54,6 +55,16 @@ def test_numpy_shape_zero_rows():
     assert numpy_shape("vec3<double>", 0) == (0, 3)
 
 
+def test_type_info_matches_individual_lookups():
+    for type_str in DIALS_TYPES:
+        dtype, elem_size, sub = type_info(type_str)
+        assert isinstance(dtype, np.dtype)
+        assert dtype == np.dtype(numpy_dtype(type_str))
+        assert elem_size == element_size(type_str)
+        assert numpy_shape(type_str, 7) == ((7,) if sub == 1 else (7, sub))
+        assert dtype.itemsize * sub == elem_size
+
+
 def test_unknown_type_raises():
     with pytest.raises(ValueError, match="Unknown DIALS type"):
         element_size("float")
@@ -61,3 +72,5 @@ def test_unknown_type_raises():
         numpy_dtype("uint32")
     with pytest.raises(ValueError, match="Unknown DIALS type"):
         numpy_shape("complex", 10)
+    with pytest.raises(ValueError, match="Unknown DIALS type"):
+        type_info("float")
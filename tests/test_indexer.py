@@ -1,13 +1,18 @@
 """Tests for refl_index.indexer."""
 
 import json
+import os
+import shutil
+import sys
 from pathlib import Path
 
+import msgpack
 import numpy as np
 import pytest
 
+from refl_index import indexer
 from refl_index.dtypes import element_size
-from refl_index.indexer import ReflIndex
+from refl_index.indexer import ReflIndex, _MsgpackScanner, _scan_mmap, _scan_unpacker
 
 
 class TestBuild:
@@ -85,6 +90,110 @@ class TestBuild:
         assert "intensity.sum.value" in index
         assert "nonexistent" not in index
 
+    def test_column_info_is_slotted_and_frozen(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        col = index["flags"]
+        assert not hasattr(col, "__dict__")
+        with pytest.raises(AttributeError):
+            col.count = 0
+        assert {col: 1}[index["flags"]] == 1
+
+    def test_index_objects_are_slotted(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        for obj in (index, index._table, index.validate()):
+            assert not hasattr(obj, "__dict__")
+
+    def test_construct_from_column_infos(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        rebuilt = ReflIndex(
+            refl_path=index.refl_path,
+            file_size=index.file_size,
+            nrows=index.nrows,
+            num_identifiers=index.num_identifiers,
+            columns=index.columns,
+        )
+        assert rebuilt.columns == index.columns
+        assert rebuilt["bbox"] == index["bbox"]
+
+    def test_columns_are_built_lazily(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        columns = index.columns
+        assert not isinstance(columns, list)
+        assert columns[-1] == columns[len(columns) - 1]
+        assert columns[1:3] == list(columns)[1:3]
+        with pytest.raises(IndexError):
+            columns[len(columns)]
+        assert index["flags"] is index["flags"]
+
+    def test_mmap_scan_matches_unpacker_scan(self, synthetic_refl):
+        path, _ = synthetic_refl
+        with open(path, "rb") as f:
+            via_unpacker = _scan_unpacker(f)
+        assert _scan_mmap(path.read_bytes()) == via_unpacker
+
+    def test_skip_int_str_pairs(self):
+        entries = {0: "a", 1: "x" * 36, 300: "y" * 300, -1: "neg", 70000: b"bin"}
+        buf = msgpack.packb(entries, use_bin_type=True) + b"\xc0"
+        scanner = _MsgpackScanner(buf)
+        assert scanner.read_map_header() == len(entries)
+        scanner.skip_int_str_pairs(len(entries))
+        assert scanner.unpack() is None
+        assert scanner.pos == len(buf)
+
+        truncated = _MsgpackScanner(buf[:20])
+        truncated.read_map_header()
+        with pytest.raises(ValueError, match="Truncated"):
+            truncated.skip_int_str_pairs(len(entries))
+
+    def test_falls_back_to_unpacker_scan(self, synthetic_refl, monkeypatch):
+        path, _ = synthetic_refl
+        expected = ReflIndex.build(path)
+
+        def unsupported(buf, validate=True):
+            raise indexer._UnexpectedTag("unsupported")
+
+        monkeypatch.setattr(indexer, "_scan_mmap", unsupported)
+        index = ReflIndex.build(path)
+        assert index.columns == expected.columns
+        assert index.nrows == expected.nrows
+
+    def test_bin32_blobs(self, synthetic_refl_large):
+        path, col_arrays = synthetic_refl_large
+        index = ReflIndex.build(path)
+
+        with open(path, "rb") as f:
+            for col in index.columns:
+                f.seek(col.blob_offset)
+                assert f.read(col.blob_size) == col_arrays[col.name].tobytes()
+
+    def test_blob_size_mismatch(self, tmp_path):
+        path = tmp_path / "bad.refl"
+        path.write_bytes(msgpack.packb([
+            b"dials::af::reflection_table",
+            1,
+            {"identifiers": {}, "nrows": 2, "data": {"x": ["double", [2, b"\x00" * 8]]}},
+        ]))
+
+        with pytest.raises(ValueError, match="blob_size=8"):
+            ReflIndex.build(path)
+        index = ReflIndex.build(path, validate=False)
+        assert index["x"].blob_size == 8
+
+    def test_truncated_file_raises(self, synthetic_refl, tmp_path):
+        path, _ = synthetic_refl
+        truncated = tmp_path / "truncated.refl"
+        truncated.write_bytes(path.read_bytes()[:200])
+        with pytest.raises(ValueError):
+            ReflIndex.build(truncated)
+
 
 class TestSaveLoad:
     def test_roundtrip(self, synthetic_refl, tmp_path):
@@ -117,6 +226,109 @@ class TestSaveLoad:
         assert saved == Path(str(path) + ".idx")
         assert saved.exists()
 
+    def test_binary_sidecar_written(self, synthetic_refl, tmp_path):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        idx_path = tmp_path / "test.refl.idx"
+        index.save(idx_path)
+        assert (tmp_path / "test.refl.idx.bin").exists()
+
+    def test_binary_roundtrip(self, synthetic_refl, tmp_path):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        bin_path = index.save_binary(tmp_path / "test.refl.idx.bin")
+        loaded = ReflIndex.load_binary(bin_path)
+
+        assert loaded.refl_path == index.refl_path
+        assert loaded.file_size == index.file_size
+        assert loaded.nrows == index.nrows
+        assert loaded.num_identifiers == index.num_identifiers
+        assert loaded.byte_order == index.byte_order
+        assert loaded.columns == index.columns
+        assert loaded["bbox"] == index["bbox"]
+
+    def test_binary_bad_magic(self, tmp_path):
+        bogus = tmp_path / "bogus.bin"
+        bogus.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError, match="magic"):
+            ReflIndex.load_binary(bogus)
+
+    def test_load_ignores_stale_sidecar(self, synthetic_refl, tmp_path):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        idx_path = tmp_path / "test.refl.idx"
+        index.save(idx_path)
+
+        # Rewrite the JSON so it is newer than the binary sidecar
+        doc = json.loads(idx_path.read_text())
+        doc["nrows"] = 12345
+        idx_path.write_text(json.dumps(doc))
+        bin_path = tmp_path / "test.refl.idx.bin"
+        stat = idx_path.stat()
+        os.utime(bin_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+
+        assert ReflIndex.load(idx_path).nrows == 12345
+
+    def test_load_ignores_sidecar_of_other_json(self, synthetic_refl, synthetic_refl_small, tmp_path):
+        path, _ = synthetic_refl
+        small_path, _ = synthetic_refl_small
+        idx_path = ReflIndex.build(path).save(tmp_path / "test.refl.idx")
+        other_path = ReflIndex.build(small_path).save(tmp_path / "small.refl.idx")
+
+        # Swap in another index's JSON with its older mtime kept
+        stat = idx_path.stat()
+        os.utime(other_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+        shutil.copy2(other_path, idx_path)
+
+        assert ReflIndex.load(idx_path).nrows == 10
+
+    def test_load_without_sidecar(self, synthetic_refl, tmp_path):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        idx_path = tmp_path / "test.refl.idx"
+        index.save(idx_path)
+        (tmp_path / "test.refl.idx.bin").unlink()
+
+        loaded = ReflIndex.load(idx_path)
+        assert loaded.column_names == index.column_names
+        assert loaded.columns == index.columns
+        assert loaded["miller_index"].type_str is sys.intern("cctbx::miller::index<>")
+        assert loaded.column_names[0] is sys.intern(index.column_names[0])
+        assert all(name is sys.intern(name) for name in loaded._table.name_to_idx)
+
+    def test_compact_and_indented_json(self, synthetic_refl, tmp_path):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        compact = index.save(tmp_path / "compact.idx")
+        pretty = index.save(tmp_path / "pretty.idx", indent=True)
+
+        assert compact.read_text().count("\n") <= 1
+        assert pretty.read_text().count("\n") > 10
+        assert compact.stat().st_size < pretty.stat().st_size
+        doc_compact, doc_pretty = json.loads(compact.read_text()), json.loads(pretty.read_text())
+        doc_compact.pop("created_at"), doc_pretty.pop("created_at")
+        assert doc_compact == doc_pretty
+
+    def test_byte_order_roundtrip(self, synthetic_refl, tmp_path):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+        assert index.byte_order == "little"
+
+        idx_path = tmp_path / "test.refl.idx"
+        index.save(idx_path)
+        (tmp_path / "test.refl.idx.bin").unlink()
+
+        # Older indices without the field default to little-endian
+        doc = json.loads(idx_path.read_text())
+        assert doc.pop("byte_order") == "little"
+        idx_path.write_text(json.dumps(doc))
+        assert ReflIndex.load(idx_path).byte_order == "little"
+
     def test_json_format(self, synthetic_refl, tmp_path):
         path, _ = synthetic_refl
         index = ReflIndex.build(path)
@@ -127,7 +339,7 @@ class TestSaveLoad:
         with open(idx_path) as f:
             doc = json.load(f)
 
-        assert doc["version"] == 1
+        assert doc["version"] == 2
         assert doc["nrows"] == 100
         assert doc["num_identifiers"] == 3
         assert doc["num_columns"] == 7
@@ -136,18 +348,122 @@ class TestSaveLoad:
         # Each column is a compact array
         for entry in doc["columns"]:
             assert len(entry) == 6  # [name, type_idx, elem_size, count, offset, blob_size]
+        assert doc["name_index"] == {entry[0]: i for i, entry in enumerate(doc["columns"])}
+
+    def test_load_version_1(self, synthetic_refl, tmp_path):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        idx_path = tmp_path / "test.refl.idx"
+        index.save(idx_path)
+        (tmp_path / "test.refl.idx.bin").unlink()
+
+        doc = json.loads(idx_path.read_text())
+        doc["version"] = 1
+        del doc["name_index"]
+        idx_path.write_text(json.dumps(doc))
+
+        loaded = ReflIndex.load(idx_path)
+        assert loaded.column_names == index.column_names
+        assert loaded["miller_index"] == index["miller_index"]
+
+    def test_save_binary_format(self, synthetic_refl, tmp_path):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        idx_path = index.save(tmp_path / "test.refl.idx", format="binary")
+        assert idx_path.read_bytes().startswith(indexer._BIN_MAGIC)
+        assert not (tmp_path / "test.refl.idx.bin").exists()
+
+        loaded = ReflIndex.load(idx_path)
+        assert loaded.columns == index.columns
+        assert loaded.validate()
+
+        with pytest.raises(ValueError, match="format"):
+            index.save(tmp_path / "x.idx", format="yaml")
+
+    def test_load_is_memoized(self, synthetic_refl, tmp_path, monkeypatch):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        idx_path = tmp_path / "test.refl.idx"
+        index.save(idx_path)
+        first = ReflIndex.load(idx_path)
+
+        def fail(path):
+            raise AssertionError("index was re-parsed")
+
+        monkeypatch.setattr(ReflIndex, "_load_file", fail)
+        second = ReflIndex.load(idx_path)
+        assert second is not first
+        assert second.column_names == first.column_names
+
+    def test_loaded_copies_are_independent(self, synthetic_refl, tmp_path):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path, checksums=True)
+        idx_path = index.save(tmp_path / "test.refl.idx")
+
+        first = ReflIndex.load(idx_path)
+        first["flags"]
+        first.column_digests[0] = "tampered"
+        first.nrows = 0
+
+        second = ReflIndex.load(idx_path)
+        assert second.column_digests == index.column_digests
+        assert second.nrows == index.nrows
+        assert second._col_cache is not first._col_cache
+        assert "flags" not in second._col_cache
+
+    def test_load_cache_misses_on_rewrite(self, synthetic_refl, tmp_path):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        idx_path = tmp_path / "test.refl.idx"
+        index.save(idx_path)
+        (tmp_path / "test.refl.idx.bin").unlink()
+        assert ReflIndex.load(idx_path).nrows == index.nrows
+
+        doc = json.loads(idx_path.read_text())
+        doc["nrows"] = 12345
+        idx_path.write_text(json.dumps(doc))
+        stat = idx_path.stat()
+        os.utime(idx_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert ReflIndex.load(idx_path).nrows == 12345
+
+    def test_load_cache_misses_on_sidecar_rewrite(self, synthetic_refl, tmp_path, monkeypatch):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        idx_path = index.save(tmp_path / "test.refl.idx")
+        ReflIndex.load(idx_path)
+
+        bin_path = index.save_binary(tmp_path / "test.refl.idx.bin")
+        stat = bin_path.stat()
+        os.utime(bin_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        parsed = []
+        load_file = ReflIndex._load_file
+        monkeypatch.setattr(ReflIndex, "_load_file", lambda path: parsed.append(path) or load_file(path))
+        assert ReflIndex.load(idx_path).nrows == index.nrows
+        assert parsed == [idx_path.resolve()]
 
 
 class TestValidate:
     def test_validate_pass(self, synthetic_refl):
         path, _ = synthetic_refl
         index = ReflIndex.build(path)
-        assert index.validate() is True
+        result = index.validate()
+        assert result
+        assert result.ok is True
+        assert result.reasons == []
 
     def test_validate_missing_file(self, synthetic_refl, tmp_path):
         path, _ = synthetic_refl
         index = ReflIndex.build(path)
-        assert index.validate(tmp_path / "nonexistent.refl") is False
+        result = index.validate(tmp_path / "nonexistent.refl")
+        assert not result
+        assert "not found" in result.reasons[0]
 
     def test_validate_wrong_size(self, synthetic_refl, tmp_path):
         path, _ = synthetic_refl
@@ -156,4 +472,91 @@ class TestValidate:
         # Create a file with different size
         fake = tmp_path / "wrong_size.refl"
         fake.write_bytes(b"x" * 10)
-        assert index.validate(fake) is False
+        assert not index.validate(fake)
+
+    def test_validate_same_size_different_content(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+        stat = path.stat()
+
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 0xFF
+        path.write_bytes(bytes(data))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        result = index.validate()
+        assert not result
+        assert any("CRC32" in r for r in result.reasons)
+
+    def test_validate_mtime_changed(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        result = index.validate()
+        assert not result
+        assert any("mtime" in r for r in result.reasons)
+
+    def test_validate_relocated_copy(self, synthetic_refl, tmp_path):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        copied = tmp_path / "moved.refl"
+        shutil.copy(path, copied)
+        os.utime(copied, ns=(index.mtime_ns + 10**9, index.mtime_ns + 10**9))
+        assert index.validate(copied)
+
+        data = bytearray(copied.read_bytes())
+        data[-1] ^= 0xFF
+        copied.write_bytes(bytes(data))
+        result = index.validate(copied)
+        assert not result
+        assert any("CRC32" in r for r in result.reasons)
+
+    def test_validate_survives_save_load(self, synthetic_refl, tmp_path):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+        idx_path = index.save(tmp_path / "test.refl.idx")
+
+        loaded = ReflIndex.load(idx_path)
+        assert loaded.sample_crc == index.sample_crc
+        assert loaded.mtime_ns == index.mtime_ns
+        assert loaded.validate()
+
+    def test_deep_validate_pass(self, synthetic_refl, tmp_path):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path, checksums=True)
+        assert len(index.column_digests) == len(index.columns)
+        assert all(len(d) == 32 for d in index.column_digests)
+        assert index.validate(deep=True)
+
+        loaded = ReflIndex.load(index.save(tmp_path / "test.refl.idx"))
+        assert loaded.column_digests == index.column_digests
+        assert loaded.validate(deep=True)
+
+    def test_deep_validate_detects_blob_change(self, synthetic_refl_large):
+        path, _ = synthetic_refl_large
+        index = ReflIndex.build(path, checksums=True)
+        stat = path.stat()
+
+        # Outside the head/tail sample, so only the deep check can see it
+        col = index["miller_index"]
+        data = bytearray(path.read_bytes())
+        data[col.blob_offset + col.blob_size // 2] ^= 0xFF
+        path.write_bytes(bytes(data))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert index.validate()
+        result = index.validate(deep=True)
+        assert not result
+        assert len(result.reasons) == 1
+        assert "'miller_index'" in result.reasons[0]
+
+    def test_deep_validate_without_checksums(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+        assert index.column_digests is None
+
+        with pytest.raises(ValueError, match="checksums=True"):
+            index.validate(deep=True)
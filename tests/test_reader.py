@@ -1,5 +1,8 @@
 """Tests for refl_index.reader."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pytest
 
@@ -126,6 +129,125 @@ class TestRowSlicing:
         np.testing.assert_array_equal(arr, expected)
         assert arr.shape == (10, 3)
 
+    def test_writable_copy(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        arr = reader.read_column("bbox", start=10, stop=30, writable=True)
+        np.testing.assert_array_equal(arr, col_arrays["bbox"][10:30])
+        assert arr.flags.writeable
+        arr[:] = 0
+        np.testing.assert_array_equal(reader.read_column("bbox", start=10, stop=30), col_arrays["bbox"][10:30])
+
+    @pytest.mark.skipif(not hasattr(os, "preadv") or not hasattr(os, "posix_fadvise"), reason="needs preadv and posix_fadvise")
+    def test_large_writable_read_hints_willneed(self, synthetic_refl, monkeypatch):
+        from refl_index import reader as reader_mod
+
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        calls = []
+        monkeypatch.setattr(reader_mod, "_FADVISE_MIN", 0)
+        monkeypatch.setattr(os, "posix_fadvise", lambda *args: calls.append(args))
+        arr = reader.read_column("bbox", start=10, stop=30, writable=True)
+        np.testing.assert_array_equal(arr, col_arrays["bbox"][10:30])
+        col = index["bbox"]
+        assert calls == [(reader._fd, col.blob_offset + 10 * col.elem_size, 20 * col.elem_size, os.POSIX_FADV_WILLNEED)]
+
+    def test_type_resolved_once_per_column(self, synthetic_refl, monkeypatch):
+        from refl_index import reader as reader_mod
+
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        calls = []
+        real = reader_mod.type_info
+        monkeypatch.setattr(reader_mod, "type_info", lambda t: calls.append(t) or real(t))
+        for start in range(0, 100, 10):
+            arr = reader.read_column("xyzcal.px", start=start, stop=start + 10)
+            np.testing.assert_array_equal(arr, col_arrays["xyzcal.px"][start:start + 10])
+        assert calls == ["vec3<double>"]
+
+
+class TestReadColumnInto:
+    def test_reuse_buffer_across_slices(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        out = np.empty((25, 3), dtype="<i4")
+        for start in range(0, 100, 25):
+            result = reader.read_column_into("miller_index", out, start=start, stop=start + 25)
+            assert result is out
+            np.testing.assert_array_equal(out, col_arrays["miller_index"][start:start + 25])
+
+    def test_read_column_out(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index, cache_bytes=1 << 20)
+
+        out = np.zeros(30, dtype="<f8")
+        assert reader.read_column("intensity.sum.value", start=5, stop=35, out=out) is out
+        np.testing.assert_array_equal(out, col_arrays["intensity.sum.value"][5:35])
+        with pytest.raises(ValueError, match="shape"):
+            reader.read_column("intensity.sum.value", out=out)
+
+    def test_rejects_mismatched_out(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        with pytest.raises(ValueError, match="shape"):
+            reader.read_column_into("miller_index", np.empty((10,), dtype="<i4"), stop=10)
+        with pytest.raises(ValueError, match="dtype"):
+            reader.read_column_into("intensity.sum.value", np.empty((10,), dtype="<f4"), stop=10)
+        with pytest.raises(ValueError, match="C-contiguous"):
+            reader.read_column_into("bbox", np.empty((6, 10), dtype="<i4").T, stop=10)
+
+
+class TestReadColumnSlices:
+    def test_slices_match_read_column(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        starts, stops = [0, 10, 40, 99, 100], [5, 10, 75, 100, 100]
+        result = reader.read_column_slices("miller_index", starts, stops)
+        assert len(result) == len(starts)
+        for arr, start, stop in zip(result, starts, stops):
+            assert not arr.flags.writeable
+            assert arr.shape == (stop - start, 3)
+            np.testing.assert_array_equal(arr, col_arrays["miller_index"][start:stop])
+        assert reader.read_column_slices("flags", [], []) == []
+
+    def test_invalid_slice_raises(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        with pytest.raises(ValueError, match="must be <= stop"):
+            reader.read_column_slices("flags", [0, 20], [10, 5])
+        with pytest.raises(IndexError, match="exceeds row count"):
+            reader.read_column_slices("flags", [0], [101])
+        with pytest.raises(ValueError, match="same length"):
+            reader.read_column_slices("flags", [0, 1], [10])
+
+
+class TestColumnMemmap:
+    def test_memmap_matches_data(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+
+        with ReflReader(index) as reader:
+            mapped = {name: reader.column_memmap(name) for name in index.column_names}
+        for name, arr in mapped.items():
+            assert isinstance(arr, np.memmap)
+            assert not arr.flags.writeable
+            np.testing.assert_array_equal(arr, col_arrays[name])
+
 
 class TestReadColumns:
     def test_read_multiple(self, synthetic_refl):
@@ -147,6 +269,151 @@ class TestReadColumns:
         assert result["intensity.sum.value"].shape == (10,)
         assert result["miller_index"].shape == (10, 3)
 
+    def test_parallel_matches_serial(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index, cache_bytes=1 << 20)
+
+        result = reader.read_columns(index.column_names, start=10, stop=90, parallel=4)
+        assert list(result) == index.column_names
+        for name, arr in result.items():
+            np.testing.assert_array_equal(arr, col_arrays[name][10:90])
+
+    def test_coalesced_matches_read_columns(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        names = ["miller_index", "intensity.sum.value", "bbox"]
+        result = reader.read_columns_coalesced(names, start=5, stop=50)
+        assert list(result) == names
+        for name in names:
+            np.testing.assert_array_equal(result[name], col_arrays[name][5:50])
+
+    def test_coalesced_without_gap_tolerance(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        result = reader.read_columns_coalesced(index.column_names, max_gap=0)
+        for name, arr in result.items():
+            np.testing.assert_array_equal(arr, col_arrays[name])
+
+    def test_read_columns_prefetches_one_run(self, synthetic_refl, monkeypatch):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        calls = []
+        monkeypatch.setattr(reader, "_prefetch", lambda offset, length: calls.append((offset, length)))
+        reader.read_columns(index.column_names)
+        assert len(calls) == 1
+
+        calls.clear()
+        result = reader.read_columns(index.column_names, start=10, stop=20, parallel=4)
+        assert len(calls) == 1
+        assert list(result) == index.column_names
+
+
+class TestReadFiltered:
+    def test_filter_by_flag_bit(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        flags = col_arrays["flags"]
+        result = reader.read_filtered("miller_index", "flags", 0x4)
+        np.testing.assert_array_equal(result, col_arrays["miller_index"][(flags & 0x4) != 0])
+
+    def test_filter_with_slice(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        flags = col_arrays["flags"][20:60]
+        result = reader.read_filtered("intensity.sum.value", "flags", 0x1, start=20, stop=60)
+        np.testing.assert_array_equal(result, col_arrays["intensity.sum.value"][20:60][(flags & 0x1) != 0])
+
+    def test_non_integer_flag_column(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        with pytest.raises(ValueError, match="scalar integer column"):
+            reader.read_filtered("flags", "intensity.sum.value", 0x1)
+
+    def test_mask_out_of_range(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        with pytest.raises(ValueError, match="'flags'"):
+            reader.read_filtered("miller_index", "flags", 1 << 40)
+        with pytest.raises(ValueError, match="'imageset_id'"):
+            reader.read_filtered("miller_index", "imageset_id", -1)
+
+
+class TestByteOrder:
+    def test_big_endian_blobs_are_swapped(self, synthetic_refl, tmp_path):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+
+        # Rewrite every blob in big-endian order
+        data = bytearray(path.read_bytes())
+        for col in index.columns:
+            swapped = col_arrays[col.name].byteswap().tobytes()
+            data[col.blob_offset:col.blob_offset + col.blob_size] = swapped
+        be_path = tmp_path / "big.refl"
+        be_path.write_bytes(bytes(data))
+
+        be_index = ReflIndex(
+            refl_path=str(be_path),
+            file_size=index.file_size,
+            nrows=index.nrows,
+            num_identifiers=index.num_identifiers,
+            columns=index.columns,
+            byte_order="big",
+        )
+        reader = ReflReader(be_index)
+        for name, expected in col_arrays.items():
+            np.testing.assert_array_equal(reader.read_column(name, start=3, stop=9), expected[3:9])
+            np.testing.assert_array_equal(reader.read_column(name, writable=True), expected)
+            np.testing.assert_array_equal(reader.column_memmap(name), expected)
+            [sliced] = reader.read_column_slices(name, [2], [7])
+            np.testing.assert_array_equal(sliced, expected[2:7])
+            assert reader.column_equals(name, expected)
+
+
+class TestCache:
+    def test_repeated_read_hits_cache(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index, cache_bytes=1 << 20)
+
+        first = reader.read_column("xyzcal.px", start=10, stop=20)
+        second = reader.read_column("xyzcal.px", start=10, stop=20)
+        assert second.base is first.base
+        np.testing.assert_array_equal(second, col_arrays["xyzcal.px"][10:20])
+
+    def test_eviction_respects_budget(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index, cache_bytes=1000)  # holds one 800-byte double column
+
+        reader.read_column("intensity.sum.value")
+        reader.read_column("imageset_id")
+        assert list(reader._cache._entries) == [("imageset_id", 0, 100)]
+        assert reader._cache._cur_bytes == 800
+
+    def test_clear_cache(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index, cache_bytes=1 << 20)
+
+        reader.read_column("flags")
+        reader.clear_cache()
+        assert not reader._cache._entries
+
 
 class TestReadColumnRaw:
     def test_raw_bytes(self, synthetic_refl):
@@ -167,6 +434,59 @@ class TestReadColumnRaw:
         expected = col_arrays["intensity.sum.value"][10:20].tobytes()
         assert raw == expected
 
+    def test_raw_memoryview(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        raw = reader.read_column_raw("miller_index", start=10, stop=20, copy=False)
+        assert isinstance(raw, memoryview)
+        assert raw.readonly
+        assert raw == col_arrays["miller_index"][10:20].tobytes()
+        raw.release()
+        assert reader.read_column_raw("miller_index", 5, 5, copy=False) == b""
+
+
+class TestColumnEquals:
+    def test_equal_and_unequal(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        expected = col_arrays["xyzcal.px"]
+        assert reader.column_equals("xyzcal.px", expected)
+        assert reader.column_equals("xyzcal.px", expected[10:20], start=10, stop=20)
+        assert reader.column_equals("xyzcal.px", np.asfortranarray(expected[10:20]), start=10, stop=20)
+
+        changed = expected.copy()
+        changed[50, 1] += 1.0
+        assert not reader.column_equals("xyzcal.px", changed)
+
+    def test_mismatched_dtype_or_shape(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        expected = col_arrays["miller_index"]
+        assert not reader.column_equals("miller_index", expected.astype("<i8"))
+        assert not reader.column_equals("miller_index", expected[:10])
+
+    def test_compares_in_chunks(self, synthetic_refl_large, monkeypatch):
+        from refl_index import reader as reader_mod
+
+        path, col_arrays = synthetic_refl_large
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        monkeypatch.setattr(reader_mod, "_COMPARE_CHUNK", 1000)
+        expected = col_arrays["xyzcal.px"]
+        assert reader.column_equals("xyzcal.px", expected)
+        assert reader.column_equals("xyzcal.px", expected[37:4321], start=37, stop=4321)
+
+        changed = expected.copy()
+        changed[-1, 2] = -changed[-1, 2]
+        assert not reader.column_equals("xyzcal.px", changed)
+
 
 class TestErrors:
     def test_missing_column(self, synthetic_refl):
@@ -200,3 +520,75 @@ class TestErrors:
 
         with pytest.raises(ValueError, match="must be <= stop"):
             reader.read_column("intensity.sum.value", start=50, stop=10)
+
+    def test_negative_stop(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        with pytest.raises(ValueError, match="non-negative"):
+            reader.read_column("intensity.sum.value", start=0, stop=-1)
+
+
+class TestLifecycle:
+    def test_context_manager_closes(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+
+        with ReflReader(index) as reader:
+            assert not reader.closed
+        assert reader.closed
+
+        with pytest.raises(ValueError, match="closed"):
+            reader.read_column("flags")
+
+    def test_del_releases_fd(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+        fd = reader._fd
+        del reader
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+    def test_concurrent_writable_reads(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            results = ex.map(lambda name: reader.read_column(name, writable=True), index.column_names)
+            for name, arr in zip(index.column_names, results):
+                np.testing.assert_array_equal(arr, col_arrays[name])
+
+    def test_arrays_outlive_reader(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+
+        with ReflReader(index) as reader:
+            arr = reader.read_column("xyzcal.px")
+        np.testing.assert_array_equal(arr, col_arrays["xyzcal.px"])
+
+    def test_arrays_are_read_only(self, synthetic_refl):
+        path, _ = synthetic_refl
+        index = ReflIndex.build(path)
+        reader = ReflReader(index)
+
+        arr = reader.read_column("intensity.sum.value")
+        assert not arr.flags.writeable
+
+    def test_views_hold_the_mapping(self, synthetic_refl):
+        path, col_arrays = synthetic_refl
+        index = ReflIndex.build(path)
+
+        with ReflReader(index) as reader:
+            arr = reader.read_column("bbox", start=5, stop=15)
+            mm = reader._mm
+        assert not arr.flags.owndata
+
+        base = arr
+        while isinstance(base, np.ndarray):
+            base = base.base
+        assert isinstance(base, memoryview) and base.obj is mm
+        assert not mm.closed
+        np.testing.assert_array_equal(arr, col_arrays["bbox"][5:15])